@@ -6,11 +6,13 @@ Example of interacting with the gripper.
 `ros2 run pymoveit2 ex_gripper_command.py --ros-args -p action:="close"`
 """
 
-from threading import Thread
-
 import rclpy
-from rclpy.callback_groups import ReentrantCallbackGroup
+from rclpy.callback_groups import (
+    MutuallyExclusiveCallbackGroup,
+    ReentrantCallbackGroup,
+)
 from rclpy.node import Node
+from rclpy.task import Future
 
 from pymoveit2 import GripperCommand
 from pymoveit2.robots import pepper_robot
@@ -44,33 +46,65 @@ def main(args=None):
         gripper_command_action_name="/LHand/gripper_command",
     )
 
-    # Spin the node in background thread(s)
-    executor = rclpy.executors.MultiThreadedExecutor(2)
-    executor.add_node(node)
-    executor_thread = Thread(target=executor.spin, daemon=True, args=())
-    executor_thread.start()
-
-    # Sleep a while in order to get the first joint state
-    node.create_rate(10.0).sleep()
-
     # Get parameter
     action = node.get_parameter("action").get_parameter_value().string_value
 
-    # Perform gripper action
-    node.get_logger().info(f'Performing gripper action "{action}"')
-    if "open" == action:
-        moveit2_gripper.open()
-        moveit2_gripper.wait_until_executed()
-    elif "close" == action:
-        moveit2_gripper.close()
+    # Future that is completed once a single gripper action is finished
+    action_done = Future()
+
+    def toggle():
+        """Toggle the gripper and wait until the motion is executed"""
+
+        moveit2_gripper()
         moveit2_gripper.wait_until_executed()
-    else:
-        period_s = 1.0
-        rate = node.create_rate(1 / period_s)
-        while rclpy.ok():
-            moveit2_gripper()
-            moveit2_gripper.wait_until_executed()
-            rate.sleep()
+
+    def on_ready():
+        """Perform the gripper action once the first joint state is received"""
+
+        ready_timer.cancel()
+        if not moveit2_gripper.wait_until_joint_state_received(timeout_sec=1.0):
+            node.get_logger().warn("No joint state received within 1.0 s.")
+
+        # Perform gripper action
+        node.get_logger().info(f'Performing gripper action "{action}"')
+        if "open" == action:
+            try:
+                moveit2_gripper.open()
+                moveit2_gripper.wait_until_executed()
+            except Exception as e:
+                action_done.set_exception(e)
+            else:
+                action_done.set_result(True)
+        elif "close" == action:
+            try:
+                moveit2_gripper.close()
+                moveit2_gripper.wait_until_executed()
+            except Exception as e:
+                action_done.set_exception(e)
+            else:
+                action_done.set_result(True)
+        else:
+            # Create timer for toggling the gripper in its own mutually exclusive group,
+            # so that a new toggle is not started while the previous one is still executing
+            period_s = 1.0
+            node.create_timer(
+                period_s, toggle, callback_group=MutuallyExclusiveCallbackGroup()
+            )
+
+    # Create one-shot timer that waits for the first joint state before performing the action
+    ready_timer = node.create_timer(
+        0.0, on_ready, callback_group=MutuallyExclusiveCallbackGroup()
+    )
+
+    # Spin the node in the main thread until the action is finished
+    # Note: A multi-threaded executor is required because the callbacks above block inside
+    #       `wait_until_executed()`, which relies on the executor servicing a rate timer
+    executor = rclpy.executors.MultiThreadedExecutor(2)
+    executor.add_node(node)
+    executor.spin_until_future_complete(action_done)
+
+    # Re-raise any exception of the gripper action on the main thread
+    action_done.result()
 
     rclpy.shutdown()
     exit(0)
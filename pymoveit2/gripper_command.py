@@ -112,6 +112,8 @@ class GripperCommand:
         self.__joint_state_mutex = threading.Lock()
         self.__joint_state = None
         self.__new_joint_state_available = False
+        # Event that is set once the first joint state is received
+        self._joint_state_ready = threading.Event()
         # Tolerance used for checking whether the gripper is open or closed
         self.__open_tolerance = [
             0.1
@@ -221,6 +223,16 @@ class GripperCommand:
         while self.__is_motion_requested or self.__is_executing:
             self.__wait_until_executed_rate.sleep()
 
+    def wait_until_joint_state_received(
+        self, timeout_sec: Optional[float] = None
+    ) -> bool:
+        """
+        Wait until the first joint state is received.
+        Returns False if `timeout_sec` elapses first.
+        """
+
+        return self._joint_state_ready.wait(timeout=timeout_sec)
+
     def __joint_state_callback(self, msg: JointState):
 
         # Update only if all relevant joints are included in the message
@@ -232,6 +244,7 @@ class GripperCommand:
         self.__joint_state = msg
         self.__new_joint_state_available = True
         self.__joint_state_mutex.release()
+        self._joint_state_ready.set()
 
     def __send_goal_async_gripper_command(
         self,
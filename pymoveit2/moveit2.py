@@ -50,6 +50,9 @@ class MoveIt2:
         ignore_new_calls_while_executing: bool = False,
         callback_group: Optional[CallbackGroup] = None,
         follow_joint_trajectory_action_name: str = "joint_trajectory_controller/follow_joint_trajectory",
+        joint_state_callback_group: Optional[CallbackGroup] = None,
+        action_callback_group: Optional[CallbackGroup] = None,
+        joint_state_qos: Optional[QoSProfile] = None,
     ):
         """
         Construct an instance of `MoveIt2` interface.
@@ -65,23 +68,41 @@ class MoveIt2:
                                                  while previous is still being executed
           - `callback_group` - Optional callback group to use for ROS 2 communication (topics/services/actions)
           - `follow_joint_trajectory_action_name` - Name of the action server for the controller
+          - `joint_state_callback_group` - Optional callback group for the joint state subscription
+                                           (defaults to `callback_group`)
+          - `action_callback_group` - Optional callback group for the action clients
+                                      (defaults to `callback_group`)
+          - `joint_state_qos` - Optional QoS profile of the joint state subscription
+                                (defaults to best effort with a queue depth of 1)
         """
 
         self._node = node
         self._callback_group = callback_group
+        self._joint_state_callback_group = (
+            joint_state_callback_group
+            if joint_state_callback_group is not None
+            else callback_group
+        )
+        self._action_callback_group = (
+            action_callback_group
+            if action_callback_group is not None
+            else callback_group
+        )
 
         # Create subscriber for current joint states
         self._node.create_subscription(
             msg_type=JointState,
             topic="joint_states",
             callback=self.__joint_state_callback,
-            qos_profile=QoSProfile(
+            qos_profile=joint_state_qos
+            if joint_state_qos is not None
+            else QoSProfile(
                 durability=QoSDurabilityPolicy.VOLATILE,
                 reliability=QoSReliabilityPolicy.BEST_EFFORT,
                 history=QoSHistoryPolicy.KEEP_LAST,
                 depth=1,
             ),
-            callback_group=self._callback_group,
+            callback_group=self._joint_state_callback_group,
         )
 
         if execute_via_moveit:
@@ -120,7 +141,7 @@ class MoveIt2:
                     history=QoSHistoryPolicy.KEEP_LAST,
                     depth=1,
                 ),
-                callback_group=self._callback_group,
+                callback_group=self._action_callback_group,
             )
         else:
             # Otherwise create a separate service client for planning
@@ -186,7 +207,7 @@ class MoveIt2:
                 history=QoSHistoryPolicy.KEEP_LAST,
                 depth=1,
             ),
-            callback_group=self._callback_group,
+            callback_group=self._action_callback_group,
         )
 
         self.__collision_object_publisher = self._node.create_publisher(
@@ -196,6 +217,8 @@ class MoveIt2:
         self.__joint_state_mutex = threading.Lock()
         self.__joint_state = None
         self.__new_joint_state_available = False
+        # Event that is set once the first joint state is received
+        self._joint_state_ready = threading.Event()
         self.__move_action_goal = self.__init_move_action_goal(
             frame_id=base_link_name,
             group_name=group_name,
@@ -455,6 +478,16 @@ class MoveIt2:
         while self.__is_motion_requested or self.__is_executing:
             self.__wait_until_executed_rate.sleep()
 
+    def wait_until_joint_state_received(
+        self, timeout_sec: Optional[float] = None
+    ) -> bool:
+        """
+        Wait until the first joint state is received.
+        Returns False if `timeout_sec` elapses first.
+        """
+
+        return self._joint_state_ready.wait(timeout=timeout_sec)
+
     def reset_controller(
         self, joint_state: Union[JointState, List[float]], sync: bool = True
     ):
@@ -902,6 +935,7 @@ class MoveIt2:
         self.__joint_state = msg
         self.__new_joint_state_available = True
         self.__joint_state_mutex.release()
+        self._joint_state_ready.set()
 
     def _send_goal_move_action_plan_only(
         self, wait_for_server_timeout_sec: Optional[float] = 1.0
@@ -1114,10 +1148,6 @@ class MoveIt2:
             feedback_callback=None,
         )
 
-        action_result.add_done_callback(
-            self.__response_callback_follow_joint_trajectory
-        )
-
         if wait_until_response:
             self.__future_done_event.clear()
             action_result.add_done_callback(
@@ -1,18 +1,42 @@
-import math
-from typing import List, Optional
+import array
+import functools
+from typing import List, Optional, Tuple
 
+import numpy as np
 from rclpy.callback_groups import CallbackGroup
 from rclpy.node import Node
+from rclpy.qos import QoSProfile
 
 from .moveit2 import *
 
 
+def _redundant_attribute(name: str) -> property:
+    """
+    Create a property that hides attribute `name` inherited from `MoveIt2`.
+    """
+
+    def getter(self):
+        raise AttributeError(
+            f"'{type(self).__name__}' object has no attribute '{name}'"
+        )
+
+    return property(getter)
+
+
 class MoveIt2Gripper(MoveIt2):
     """
     Python interface for MoveIt 2 Gripper that is controlled by JointTrajectoryController.
     This implementation builds on MoveIt2 to reuse code (while keeping MoveIt2 standalone).
     """
 
+    # Pose-related functionality of MoveIt2 is not applicable to a gripper
+    move_to_pose = _redundant_attribute("move_to_pose")
+    set_pose_goal = _redundant_attribute("set_pose_goal")
+    set_position_goal = _redundant_attribute("set_position_goal")
+    set_orientation_goal = _redundant_attribute("set_orientation_goal")
+    compute_fk = _redundant_attribute("compute_fk")
+    compute_ik = _redundant_attribute("compute_ik")
+
     def __init__(
         self,
         node: Node,
@@ -26,6 +50,9 @@ class MoveIt2Gripper(MoveIt2):
         skip_planning_fixed_motion_duration: float = 0.5,
         callback_group: Optional[CallbackGroup] = None,
         follow_joint_trajectory_action_name: str = "gripper_trajectory_controller/follow_joint_trajectory",
+        joint_state_callback_group: Optional[CallbackGroup] = None,
+        action_callback_group: Optional[CallbackGroup] = None,
+        joint_state_qos: Optional[QoSProfile] = None,
     ):
         # Validation of inputs
         if len(gripper_joint_names) != len(open_gripper_joint_positions) or len(gripper_joint_names) != len(closed_gripper_joint_positions):
@@ -41,45 +68,55 @@ class MoveIt2Gripper(MoveIt2):
             ignore_new_calls_while_executing=ignore_new_calls_while_executing,
             callback_group=callback_group,
             follow_joint_trajectory_action_name=follow_joint_trajectory_action_name,
+            joint_state_callback_group=joint_state_callback_group,
+            action_callback_group=action_callback_group,
+            joint_state_qos=joint_state_qos,
         )
-        self.__del_redundant_attributes()
 
-        self.__open_gripper_joint_positions = open_gripper_joint_positions
-        self.__closed_gripper_joint_positions = closed_gripper_joint_positions
+        # Store configurations as typed arrays that ROS messages accept without conversion
+        # Note: `reset_controller()` (via `init_joint_state()`) stores these arrays by reference
+        #       in the outgoing `JointState` and goal, so they must never be modified in place
+        self.__open_gripper_joint_positions = array.array(
+            "d", open_gripper_joint_positions
+        )
+        self.__closed_gripper_joint_positions = array.array(
+            "d", closed_gripper_joint_positions
+        )
 
         self.__skip_planning = skip_planning
         if skip_planning:
-            duration_sec = math.floor(skip_planning_fixed_motion_duration)
-            duration_nanosec = int(
-                10e8 * (skip_planning_fixed_motion_duration - duration_sec)
+            duration_sec, duration_fraction = divmod(
+                skip_planning_fixed_motion_duration, 1.0
             )
-            self.__open_dummy_trajectory_goal = init_follow_joint_trajectory_goal(
-                init_dummy_joint_trajectory_from_state(
-                    init_joint_state(
-                        joint_names=gripper_joint_names,
-                        joint_positions=open_gripper_joint_positions,
-                    ),
-                    duration_sec=duration_sec,
-                    duration_nanosec=duration_nanosec,
+            duration_sec = int(duration_sec)
+            duration_nanosec = int(int(1e9) * duration_fraction)
+            self.__open_dummy_trajectory_goal = (
+                _init_dummy_follow_joint_trajectory_goal(
+                    tuple(gripper_joint_names),
+                    tuple(open_gripper_joint_positions),
+                    duration_sec,
+                    duration_nanosec,
                 )
             )
-            self.__close_dummy_trajectory_goal = init_follow_joint_trajectory_goal(
-                init_dummy_joint_trajectory_from_state(
-                    init_joint_state(
-                        joint_names=gripper_joint_names,
-                        joint_positions=closed_gripper_joint_positions,
-                    ),
-                    duration_sec=duration_sec,
-                    duration_nanosec=duration_nanosec,
+            self.__close_dummy_trajectory_goal = (
+                _init_dummy_follow_joint_trajectory_goal(
+                    tuple(gripper_joint_names),
+                    tuple(closed_gripper_joint_positions),
+                    duration_sec,
+                    duration_nanosec,
                 )
             )
 
-        # Tolerance for open/close position checks
-        self.__open_tolerance = [
-            0.1 * abs(o - c) for o, c in zip(open_gripper_joint_positions, closed_gripper_joint_positions)
-        ]
-        self.__gripper_joint_indices: Optional[List[int]] = None
-
+        # Open configuration and tolerance for open/close position checks
+        # NumPy views share the buffers of the typed arrays above
+        self.__open_gripper_joint_positions_np = np.frombuffer(
+            self.__open_gripper_joint_positions, dtype=np.float64
+        )
+        self.__open_tolerance = 0.1 * np.abs(
+            self.__open_gripper_joint_positions_np
+            - np.frombuffer(self.__closed_gripper_joint_positions, dtype=np.float64)
+        )
+        self.__gripper_joint_indices: Optional[np.ndarray] = None
 
     def __call__(self):
         """
@@ -93,7 +130,7 @@ class MoveIt2Gripper(MoveIt2):
         Toggles the gripper between open and closed state.
         """
 
-        if self.is_open:
+        if self._compute_open_state():
             self.close(skip_if_noop=False)
         else:
             self.open(skip_if_noop=False)
@@ -104,7 +141,7 @@ class MoveIt2Gripper(MoveIt2):
         - `skip_if_noop` - No action will be performed if the gripper is already open.
         """
 
-        if skip_if_noop and self.is_open:
+        if skip_if_noop and self._compute_open_state():
             return
 
         if self.__skip_planning:
@@ -120,7 +157,7 @@ class MoveIt2Gripper(MoveIt2):
         - `skip_if_noop` - No action will be performed if the gripper is not open.
         """
 
-        if skip_if_noop and self.is_closed:
+        if skip_if_noop and not self._compute_open_state():
             return
 
         if self.__skip_planning:
@@ -164,20 +201,7 @@ class MoveIt2Gripper(MoveIt2):
             wait_until_response=False,
         )
 
-    def __del_redundant_attributes(self):
-
-        self.move_to_pose = None
-        self.set_pose_goal = None
-        self.set_position_goal = None
-        self.set_orientation_goal = None
-        self.compute_fk = None
-        self.compute_ik = None
-
-    @property
-    def is_open(self) -> bool:
-        """
-        Gripper is considered to be open if all of the joints are at their open position.
-        """
+    def _compute_open_state(self) -> bool:
 
         joint_state = self.joint_state
 
@@ -187,24 +211,36 @@ class MoveIt2Gripper(MoveIt2):
 
         # For the sake of performance, find the indices of joints only once.
         # This is especially useful for robots with many joints.
-        if self.__gripper_joint_indices is None:
-            self.__gripper_joint_indices: List[int] = []
-            for joint_name in self.joint_names:
-                self.__gripper_joint_indices.append(joint_state.name.index(joint_name))
-
-        for local_joint_index, joint_state_index in enumerate(
-            self.__gripper_joint_indices
-        ):
-            if (
-                abs(
-                    joint_state.position[joint_state_index]
-                    - self.__open_gripper_joint_positions[local_joint_index]
+        gripper_joint_indices = self.__gripper_joint_indices
+        if gripper_joint_indices is None:
+            joint_name_to_index = {
+                joint_name: i for i, joint_name in enumerate(joint_state.name)
+            }
+            gripper_joint_indices = np.asarray(
+                [joint_name_to_index[joint_name] for joint_name in self.joint_names],
+                dtype=np.intp,
+            )
+            self.__gripper_joint_indices = gripper_joint_indices
+
+        # Gather the gripper joint positions and compare all of them at once
+        joint_positions = np.asarray(joint_state.position, dtype=np.float64)
+        return bool(
+            (
+                np.abs(
+                    joint_positions[gripper_joint_indices]
+                    - self.__open_gripper_joint_positions_np
                 )
-                > self.__open_tolerance[local_joint_index]
-            ):
-                return False
+                <= self.__open_tolerance
+            ).all()
+        )
 
-        return True
+    @property
+    def is_open(self) -> bool:
+        """
+        Gripper is considered to be open if all of the joints are at their open position.
+        """
+
+        return self._compute_open_state()
 
     @property
     def is_closed(self) -> bool:
@@ -212,4 +248,29 @@ class MoveIt2Gripper(MoveIt2):
         Gripper is considered to be closed if any of the joints is outside of their open position.
         """
 
-        return not self.is_open
+        return not self._compute_open_state()
+
+
+@functools.lru_cache(maxsize=64)
+def _init_dummy_follow_joint_trajectory_goal(
+    joint_names: Tuple[str, ...],
+    joint_positions: Tuple[float, ...],
+    duration_sec: int,
+    duration_nanosec: int,
+) -> FollowJointTrajectory.Goal:
+    """
+    Construct a dummy trajectory goal that moves `joint_names` to `joint_positions`.
+    Goals are memoised so that gripper instances with the same configuration share them,
+    which means that the returned goal must not be modified.
+    """
+
+    return init_follow_joint_trajectory_goal(
+        init_dummy_joint_trajectory_from_state(
+            init_joint_state(
+                joint_names=list(joint_names),
+                joint_positions=list(joint_positions),
+            ),
+            duration_sec=duration_sec,
+            duration_nanosec=duration_nanosec,
+        )
+    )